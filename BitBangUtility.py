@@ -2,6 +2,7 @@
 # /// script
 # requires-python = ">=3.8"
 # dependencies = [
+#     "numpy",
 #     "spidev",
 # ]
 # ///
@@ -17,6 +18,9 @@ Created on Wed Sep  6 02:00:13 2023
 """
 
 import argparse
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import IEBusBitBang
 from IEBusMessage import IEBusMessage
 
@@ -105,15 +109,18 @@ Examples:
 	# Process raw Sigrok files (no protocol decoding)
 	elif args.filesRaw:
 		print(f"Processing raw Sigrok files: {args.filesRaw}")
-		buf = IEBusBitBang.make_output_from_sigrok_data(args.filesRaw, args.channel)
+		# Captured data has unknown idle padding either side, so trim it here
+		buf = IEBusBitBang.make_output_from_sigrok_data(args.filesRaw, args.channel).encode('ascii').strip(b'1')
 		
 	# Process Sigrok files with IEBus protocol decoding
 	else:
 		print(f"Processing Sigrok files with protocol decoding: {args.files}")
 		import SigrokUtil
 
-		# Extract messages from all capture files
-		messageLists = [SigrokUtil.getIEBus(file) for file in args.files]
+		# Extract messages from all capture files; each sigrok-cli run is an
+		# independent subprocess, so decode the captures concurrently
+		with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+			messageLists = list(executor.map(SigrokUtil.getIEBus, args.files))
 		messages = []
 		for messageList in messageLists:
 			messages += messageList
@@ -136,33 +143,31 @@ Examples:
 			totalLength = messages[-1][0] + len(messageSignals[-1])
 
 		# Build complete signal with proper timing
-		signal = ['1'] * totalLength  # Initialize with idle state
-		for i, ieBusMessage in enumerate(ieBusMessages):
-			if args.regular != 0:
-				time = i * args.regular  # Fixed spacing
-			else:
-				time = messages[i][0]  # Original timing
-			messageOutput = list(IEBusBitBang.make_output_from_iebus_message(ieBusMessage))
-			messageLen = len(messageOutput)
-			signal[time:time+messageLen] = messageOutput
-
-		buf = ''.join(signal)
+		if args.regular != 0:
+			offsets = [i * args.regular for i in range(len(ieBusMessages))]  # Fixed spacing
+		else:
+			offsets = [row[0] for row in messages]  # Original timing
+		signal = IEBusBitBang.assemble_signal(totalLength, offsets, messageSignals)
+
+		# The builder knows where the first message starts and the last one
+		# ends, so slice directly instead of scanning the idle fill
+		signalEnd = offsets[-1] + len(messageSignals[-1])
+		buf = bytes(signal[offsets[0]:signalEnd])
 
 	# Add idle bits either side
-	buf = buf.strip('1')
-	buf = '1' * 10000 + buf + '1' * 10000
+	buf = b'1' * 10000 + buf + b'1' * 10000
 	
 	# Add glitch bits for driver robustness testing
 	if args.glitch != 0:
 		print(f"Adding {args.glitch} glitch bits for robustness testing")
-		buf = '1' * args.glitch + buf
+		buf = b'1' * args.glitch + buf
 
 	# Output or transmit the signal
 	if args.simulate:
 		print(f"Simulation mode - bit sequence length: {len(buf)}")
 		if args.slowdown != 1.0:
 			print(f"Note: --slowdown {args.slowdown} would be applied during actual transmission")
-		print(buf)
+		print(buf.decode('ascii'))
 	else:
 		print(f"Transmitting via SPI bit-bang (slowdown factor: {args.slowdown}x)...")
 		import SPIBitBang
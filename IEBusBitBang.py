@@ -13,7 +13,13 @@ Based on IEBus Mode 2 timing specifications:
 - Logic 0: 4/5 * T_Bit high, 1/5 * T_Bit low
 - Logic 1: 1/2 * T_Bit high, 1/2 * T_Bit low
 """
+import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from IEBusMessage import IEBusMessage
 
 bitRate = 1000000
 
@@ -64,78 +70,135 @@ def make_output_from_bit(bitVal):
 	Returns:
 		str: Bit sequence string for transmission
 	"""
-	if bitVal == 0:
-		return make_output_segment(True, T_Bit_0) + make_output_segment(False, (T_Bit - T_Bit_0))
-	else:
-		return make_output_segment(True, T_Bit_1) + make_output_segment(False, (T_Bit - T_Bit_1))
+	return _BIT_PATTERNS[0 if bitVal == 0 else 1]
+
+
+# The only two possible per-bit output patterns, precomputed once so the
+# per-bit work is a tuple lookup rather than two allocations and a concat
+_BIT_PATTERNS = (
+	make_output_segment(True, T_Bit_0) + make_output_segment(False, (T_Bit - T_Bit_0)),
+	make_output_segment(True, T_Bit_1) + make_output_segment(False, (T_Bit - T_Bit_1)),
+)
+
+# The same patterns as uint8 arrays, so whole messages can be expanded
+# with a single vectorized index operation
+_BIT_TABLE = np.stack([
+	np.frombuffer(pattern.encode('ascii'), dtype=np.uint8) for pattern in _BIT_PATTERNS
+])
+
+# Fixed transmission segments: extended start bit + sync header and the
+# post-transmission wait footer
+_START_SEGMENT = (make_output_segment(True, T_StartBit)
+				  + make_output_segment(False, T_Bit_1)).encode('ascii')
+_WAIT_SEGMENT = make_output_segment(False, T_TxWait).encode('ascii')
+
+
+def _make_data_byte_lut():
+	"""
+	Precompute the fully expanded transmission segment for every possible
+	data byte value: 8 data bits, the odd parity bit, and the default NAK
+	acknowledge bit. Message assembly then reduces to one table lookup
+	per data byte.
+	"""
+	valueBits = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1)
+	fieldBits = np.empty((256, IEBusMessage.DataFieldLength), dtype=np.uint8)
+	fieldBits[:, :8] = valueBits
+	fieldBits[:, 8] = np.bitwise_xor.reduce(valueBits, axis=1)  # Odd parity
+	fieldBits[:, 9] = IEBusMessage.DefaultAckVal
+	return tuple(_BIT_TABLE[row].tobytes() for row in fieldBits)
+
+_DATA_BYTE_LUT = _make_data_byte_lut()
 
 
 def make_output_from_iebus_bits(messageBits):
 	"""
 	Convert a sequence of message bits into a complete IEBus transmission.
-	
+
 	Adds proper start bit, sync period, and transmission wait time according
-	to IEBus protocol requirements.
-	
+	to IEBus protocol requirements. The per-bit expansion is done as a single
+	vectorized table lookup rather than per-bit string concatenation.
+
 	Args:
 		messageBits (list): List of boolean values representing message bits
-		
+
 	Returns:
-		str: Complete transmission bit sequence
+		bytes: Complete transmission bit sequence as b'0'/b'1' characters
 	"""
-	bitStr = ''
-	bitStr += make_output_segment(True, T_StartBit)  # Extended start bit
-	bitStr += make_output_segment(False, T_Bit_1)    # Sync period
-	for bitVal in messageBits:
-		bitStr += make_output_from_bit(bitVal)
-	bitStr += make_output_segment(False, T_TxWait)   # Post-transmission wait
-	return bitStr
+	bits = np.asarray(messageBits, dtype=np.uint8)
+	messageOutput = _BIT_TABLE[bits].tobytes()
+	return _START_SEGMENT + messageOutput + _WAIT_SEGMENT
 
 
 def make_output_from_iebus_message(message):
 	"""
 	Convert an IEBusMessage object into a bit sequence for transmission.
 
+	The header fields (through data length) are expanded with the
+	vectorized bit table; each data byte is appended from the precomputed
+	256-entry segment table, which already includes its odd parity and the
+	default NAK acknowledge bit.
+
 	Args:
 		message (IEBusMessage): IEBus message object
 
 	Returns:
-		str: Bit sequence ready for hardware transmission
+		bytes: Bit sequence ready for hardware transmission
 	"""
-	msgBytes = message.getAsBytes()
-	msgBits = bytes_to_bits(msgBytes)
-	msgBits = msgBits[:message.getLengthInBits()]
-	lineOutputBits = make_output_from_iebus_bits(msgBits)
-	return lineOutputBits
+	headerBits = bytes_to_bits(message.getAsBytes())[:IEBusMessage.Data(0).BitOffset]
+	headerOutput = _BIT_TABLE[headerBits].tobytes()
+	dataOutput = b''.join([_DATA_BYTE_LUT[b] for b in message.getData()])
+	return _START_SEGMENT + headerOutput + dataOutput + _WAIT_SEGMENT
 
 	
+def assemble_signal(totalLength, offsets, segments):
+	"""
+	Assemble message bit sequences into a single idle-filled timeline.
+
+	Each segment is placed at its offset with a contiguous slice
+	assignment, so the per-message cost is a single C-level copy.
+
+	Args:
+		totalLength (int): Length of the timeline in bit times
+		offsets (list): Start position of each segment in bit times
+		segments (list): Bit sequences (bytes) to place at each offset
+
+	Returns:
+		bytearray: Timeline filled with idle '1' outside the segments
+	"""
+	signal = bytearray(b'1') * totalLength
+	for offset, segment in zip(offsets, segments):
+		signal[offset:offset + len(segment)] = segment
+	return signal
+
+
 def bytes_to_bits(messageBytes):
 	"""
-	Convert byte array to list of boolean bit values.
-	
+	Convert byte array to an array of bit values, most significant bit first.
+
 	Args:
 		messageBytes (bytes): Raw message bytes
-		
+
 	Returns:
-		list: List of boolean values (True=1, False=0)
+		numpy.ndarray: uint8 array of 0/1 bit values
 	"""
-	bitStr = ''.join(['{:08b}'.format(b) for b in messageBytes])
-	bits = [c=='1' for c in bitStr]
-	return bits
+	return np.unpackbits(np.frombuffer(bytes(messageBytes), dtype=np.uint8))
 
 
 def bits_to_bytes(bitStr):
 	"""
 	Convert bit string to byte array, padding incomplete bytes with '1'.
-	
+
 	Args:
-		bitStr (str): String of '0' and '1' characters
-		
+		bitStr (str or bytes): Sequence of '0' and '1' characters
+
 	Returns:
 		bytes: Packed byte array suitable for SPI transmission
 	"""
-	byteStrings = [bitStr[i:i+8].ljust(8,'1') for i in range(0, len(bitStr), 8)]
-	return bytes([int(byteStr,2) for byteStr in byteStrings])
+	if isinstance(bitStr, str):
+		bitStr = bitStr.encode('ascii')
+	bits = np.frombuffer(bitStr, dtype=np.uint8) - ord('0')
+	bits = np.pad(bits, (0, (-bits.size) % 8), constant_values=1)
+	return np.packbits(bits).tobytes()
 
 
 def plot_output(lineOutputBits):
@@ -143,10 +206,12 @@ def plot_output(lineOutputBits):
 	Plot the bit sequence using matplotlib for visualization.
 	
 	Args:
-		lineOutputBits (str): Bit sequence string to plot
+		lineOutputBits (str or bytes): Bit sequence to plot
 	"""
 	import matplotlib
-	outputVals = [int(c) for c in lineOutputBits]
+	if isinstance(lineOutputBits, str):
+		lineOutputBits = lineOutputBits.encode('ascii')
+	outputVals = np.frombuffer(lineOutputBits, dtype=np.uint8) - ord('0')
 	matplotlib.pyplot.step(range(len(outputVals)), outputVals)
 
 
@@ -166,22 +231,30 @@ def make_output_from_sigrok_data(file, channel_to_read, file_sample_rate):
 		str: Downsampled bit sequence string
 	"""
 	if type(file) is list:
-		return ''.join([make_output_from_sigrok_data(f, channel_to_read, file_sample_rate) for f in file])
+		# Each file is an independent sigrok-cli subprocess; run them concurrently
+		with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+			return ''.join(executor.map(
+				lambda f: make_output_from_sigrok_data(f, channel_to_read, file_sample_rate), file))
 
 	sampleN = round(file_sample_rate / bitRate)
 
-	output_bits = ''
+	channelName = channel_to_read.encode('ascii')
+	segments = []
 	command= ['sigrok-cli', '-i', file, '-O', 'bits']
-	output = subprocess.check_output(command, stderr=subprocess.DEVNULL).decode()
-	for line in output.split('\n'):
-		try:
-			channel, bitStr = line.split(':')
-			if channel == channel_to_read:
-				bitStr = bitStr.replace(' ', '').strip()
-				output_bits += bitStr
-		except:
-			pass
-	return output_bits[0::sampleN]
+	output = subprocess.check_output(command, stderr=subprocess.DEVNULL)
+	for line in output.splitlines():
+		# Explicit check instead of try/except - raising and catching on
+		# every non-matching line is costly for million-line captures
+		idx = line.find(b':')
+		if idx < 0 or line[:idx] != channelName:
+			continue
+		segments.append(np.frombuffer(line[idx+1:], dtype=np.uint8))
+	if not segments:
+		return ''
+	bits = np.concatenate(segments)
+	# Keep only the '0'/'1' samples, dropping sigrok's per-byte spacing
+	bits = bits[(bits == ord('0')) | (bits == ord('1'))]
+	return bits[0::sampleN].tobytes().decode('ascii')
 
 	
 
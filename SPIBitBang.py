@@ -20,6 +20,10 @@ spi.mode = 2
 bitRate = spi.max_speed_hz
 print(f"SPI bit rate configured: {bitRate} Hz")
 
+# Transfer block size; keeps the driver buffer bounded while the kernel
+# pipelines successive writes
+writeChunkSize = 64 * 1024
+
 def bit_bang(output_as_bytes, slowdown=1.0):
 	"""
 	Transmit byte array via SPI at configured bit rate.
@@ -48,7 +52,11 @@ def bit_bang(output_as_bytes, slowdown=1.0):
 		spi.max_speed_hz = adjusted_speed
 	
 	try:
-		spi.writebytes2(output_as_bytes)
+		# Stream in bounded chunks rather than handing the driver the whole
+		# multi-megabyte buffer at once; memoryview slices avoid copies
+		output = memoryview(output_as_bytes)
+		for i in range(0, len(output), writeChunkSize):
+			spi.writebytes2(output[i:i + writeChunkSize])
 	finally:
 		# Restore original speed
 		if slowdown != 1.0:
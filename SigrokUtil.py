@@ -14,6 +14,8 @@ import subprocess
 import csv
 import json
 import argparse
+import os
+from concurrent.futures import ThreadPoolExecutor
 
 def getChannels(file, rx_channel=None, tx_channel=None):
 	"""
@@ -131,7 +133,7 @@ def getIEBus(file, rx_channel=None, tx_channel=None):
 
 	# Remove RX messages that match TX messages (deduplication)
 	# This removes our own transmitted messages from the capture
-	outputTxRounded = [roundTime(row) for row in outputTx]
+	outputTxRounded = set(roundTime(row) for row in outputTx)
 	outputRx = [row for row in outputRx if roundTime(row) not in outputTxRounded]
 	
 	# Format output with channel labels
@@ -143,21 +145,6 @@ def getIEBus(file, rx_channel=None, tx_channel=None):
 
 	return messages
 
-def areStringsEqual(sList):
-	"""
-	Check if all strings in a list are identical.
-	
-	Args:
-		sList (list): List of strings to compare
-		
-	Returns:
-		bool: True if all strings are equal, False otherwise
-	"""
-	for i in range(len(sList)-1):
-		if sList[i] != sList[i+1]:
-			return False
-	return True
-
 if __name__ == '__main__':
 	from tabulate import tabulate
 	
@@ -194,17 +181,16 @@ Examples:
 
 	# Generate output filename from common prefix of input files
 	if files:
-		baseFileNameLen = len(files[0])
-		baseFileNames = [s[:baseFileNameLen] for s in files]
-		while not areStringsEqual(baseFileNames):
-			baseFileNameLen -= 1
-			baseFileNames = [s[:baseFileNameLen] for s in files]
-		outFileName = baseFileNames[0] + '.txt'
-
-		# Process all files and extract messages
+		outFileName = os.path.commonprefix(files) + '.txt'
+
+		# Process all files and extract messages; each sigrok-cli run is an
+		# independent subprocess, so decode the captures concurrently
+		with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+			messageLists = list(executor.map(
+				lambda file: getIEBus(file, args.rx_channel, args.tx_channel), files))
 		messages = []
-		for file in files:
-			messages += getIEBus(file, args.rx_channel, args.tx_channel)
+		for messageList in messageLists:
+			messages += messageList
 		
 		# Output results to console and file
 		with open(outFileName, 'w') as fOut: